@@ -120,6 +120,7 @@ def download_segments(
         [SegmentSequence, str], str
     ] = compose_default_segment_filename,
     progress_reporter: ProgressReporter | None = None,
+    max_workers: int = 1,
 ) -> list[Path]:
     """Downloads segments.
 
@@ -131,6 +132,7 @@ def download_segments(
         output_filename: A callable to compose segment filenames.
         progress_reporter: An instance of :class:`ProgressReporter`-like class
           to show downloading progress. Defaults to dummy progress reporter.
+        max_workers: A number of segments to request concurrently per stream.
 
     Returns:
         A list of downloaded segment paths.
@@ -146,7 +148,12 @@ def download_segments(
     download_generator = chained_zip(
         *[
             zip(
-                iter_segments(sequence_numbers, base_url, session=playback.session),
+                iter_segments(
+                    sequence_numbers,
+                    base_url,
+                    session=playback.session,
+                    max_workers=max_workers,
+                ),
                 repeat(task, len(sequence_numbers)),
             )
             for task, base_url in enumerate(base_urls)
@@ -175,6 +182,7 @@ def download_excerpt(
     need_cut: bool = True,
     merge_kwargs: dict[str, Any] | None = None,
     progress_reporter: ProgressReporter | None = None,
+    max_workers: int = 1,
 ) -> ExcerptDownloadResult:
     """Downloads and merges audio and/or video segments.
 
@@ -192,6 +200,7 @@ def download_excerpt(
         merge_kwargs: Arguments that :meth:`ytpb.merge.merge_segments` takes.
         progress_reporter: An instance of :class:`ProgressReporter`-like class
           to show downloading progress. Defaults to dummy progress reporter.
+        max_workers: A number of segments to request concurrently per stream.
 
     Returns:
         An :class:`ExcerptDownloadResult` object.
@@ -207,7 +216,11 @@ def download_excerpt(
     segments_directory.mkdir(parents=True, exist_ok=True)
 
     _downloaded_paths: list[list[Path]] = download_segments(
-        playback, rewind_interval.sequences, all_streams, segments_directory
+        playback,
+        rewind_interval.sequences,
+        all_streams,
+        segments_directory,
+        max_workers=max_workers,
     )
     downloaded_paths: list[list[Path]] = [[], []]
     if audio_stream:
@@ -194,6 +194,7 @@ def frame_command(
             try:
                 sl = SegmentLocator(
                     reference_base_url,
+                    reference_sequence=head_sequence,
                     temp_directory=playback.get_temp_directory(),
                     session=playback.session,
                 )
@@ -257,9 +258,10 @@ def frame_command(
     image = extract_frame_as_image(moment_segment, requested_moment_date)
     image.save(final_output_path, quality=80)
 
-    try:
-        saved_to_path_value = final_output_path.relative_to(Path.cwd())
-    except ValueError:
+    cwd = Path.cwd()
+    if final_output_path.is_relative_to(cwd):
+        saved_to_path_value = final_output_path.relative_to(cwd)
+    else:
         saved_to_path_value = final_output_path
     click.echo(f"\nSuccess! Saved to '{saved_to_path_value}'.")
 
@@ -481,9 +483,10 @@ def timelapse_command(
             _save_ith_frame_as_image(image, final_output_path, i)
             capturing_progress.advance(capturing_task)
 
-    try:
-        saved_to_path_value = final_output_path.parent.relative_to(Path.cwd())
-    except ValueError:
+    cwd = Path.cwd()
+    if final_output_path.parent.is_relative_to(cwd):
+        saved_to_path_value = final_output_path.parent.relative_to(cwd)
+    else:
         saved_to_path_value = final_output_path.parent
     click.echo(f"\nSuccess! Saved to '{saved_to_path_value}'.")
 
@@ -1,22 +1,25 @@
-import pickle
+import json
+import os
 import shutil
 import sys
 from datetime import datetime, timedelta, timezone
-from functools import partial
+from functools import cache, partial
+from itertools import chain
 from pathlib import Path
-from typing import Any, Callable, TypedDict
+from typing import Any, Callable, Iterable, TypedDict
 
 import click
 import cloup
 import structlog
 from cloup.constraints import constraint, mutually_exclusive, require_any
 
-from ytpb import actions
 from ytpb.cli.common import (
     create_playback,
     echo_notice,
     find_earliest_sequence,
+    get_boundary_segments,
     get_parameter_by_name,
+    locate_interval_with_cache,
     print_summary_info,
     query_streams_or_exit,
     raise_for_sequence_ahead_of_current,
@@ -32,7 +35,12 @@ from ytpb.cli.options import (
     validate_output_path,
     yt_dlp_option,
 )
-from ytpb.cli.parameters import FormatSpecParamType, FormatSpecType, InputRewindInterval
+from ytpb.cli.parameters import (
+    FormatSpecParamType,
+    FormatSpecType,
+    InputRewindInterval,
+    RAW_INTERVAL_META_KEY,
+)
 from ytpb.cli.templating import (
     AudioStreamOutputPathContext,
     check_is_template,
@@ -48,7 +56,7 @@ from ytpb.cli.utils.path import (
 )
 from ytpb.download import compose_default_segment_filename
 from ytpb.errors import SequenceLocatingError
-from ytpb.merge import merge_segments
+from ytpb.playback import RewindInterval
 from ytpb.types import (
     AudioOrVideoStream,
     DateInterval,
@@ -91,24 +99,100 @@ class MetadataTagsContext(TypedDict):
     end_segment: str
 
 
-def compose_resume_filename(
-    video_id: str, streams: list[AudioOrVideoStream | None]
-) -> str:
-    for i, arg in enumerate(sys.argv):
-        if arg in ("--interval", "-i"):
-            interval_option_value = sys.argv[i + 1]
-            break
+DEFAULT_CONCURRENCY = 4
+RESUME_FILE_SCHEMA_VERSION = 2
+RESUME_FILENAME_INTERVAL_TABLE = str.maketrans("/", "-", "-:@")
 
-    interval_part = interval_option_value
-    for char in "-:@":
-        interval_part = interval_part.replace(char, "")
-    interval_part = interval_part.replace("/", "-")
 
+def compose_resume_filename(
+    video_id: str, streams: list[AudioOrVideoStream | None], interval: str
+) -> str:
+    interval_part = interval.translate(RESUME_FILENAME_INTERVAL_TABLE)
     itag_part = "".join([stream.itag for stream in streams if stream])
-
     return f"{video_id}-{interval_part}-{itag_part}.resume"
 
 
+class ResumeState(TypedDict):
+    #: A version of the resume file schema.
+    schema_version: int
+    #: A located rewind interval, see :meth:`RewindInterval.to_dict`.
+    interval: dict
+    #: An absolute path of the segments output directory.
+    segments_output_directory: str
+    #: Whether the segments output directory has been created by the run.
+    segments_output_directory_created: bool
+
+
+def _read_resume_file(path: Path) -> tuple[ResumeState, RewindInterval] | None:
+    """Reads a resume file and parses its rewind interval.
+
+    Returns None if the file has an unsupported schema or is malformed.
+    """
+    try:
+        # Leftover resume files from older versions are pickled and not
+        # decodable as UTF-8, which is also covered by ValueError.
+        state = json.loads(path.read_bytes())
+    except ValueError:
+        return None
+    if not isinstance(state, dict):
+        return None
+    if state.get("schema_version") != RESUME_FILE_SCHEMA_VERSION:
+        return None
+    if not (
+        isinstance(state.get("interval"), dict)
+        and isinstance(state.get("segments_output_directory"), str)
+        and isinstance(state.get("segments_output_directory_created"), bool)
+    ):
+        return None
+    try:
+        rewind_interval = RewindInterval.from_dict(state["interval"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return state, rewind_interval
+
+
+def _write_resume_file(path: Path, state: ResumeState) -> None:
+    # Write to a temporary file first to not leave a partially written resume
+    # file behind on interruption.
+    temp_path = path.with_suffix(".resume.tmp")
+    with open(temp_path, "wb") as f:
+        f.write(json.dumps(state).encode())
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def _find_latest_downloaded_sequence(
+    directory: Path, itag: str
+) -> SegmentSequence | None:
+    """Finds the latest sequence number among segments downloaded to a directory."""
+    latest_sequence: SegmentSequence | None = None
+    itag_part = f"i{itag}."
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            sequence_part, _, rest = entry.name.partition(".")
+            if not rest.startswith(itag_part) or not sequence_part.isdigit():
+                continue
+            sequence = int(sequence_part)
+            if latest_sequence is None or sequence > latest_sequence:
+                latest_sequence = sequence
+    return latest_sequence
+
+
+def _remove_segment(path: str | Path) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        logger.warning("Could not remove segment: %s", path)
+
+
+def _remove_segments(paths: Iterable[str | Path]) -> None:
+    for path in paths:
+        _remove_segment(path)
+
+
 @cloup.command("download", short_help="Download excerpts.", help="Download an excerpt.")
 @cloup.option_group(
     "Input options",
@@ -198,6 +282,14 @@ def compose_resume_filename(
 @click.option(
     "--ignore-resume", is_flag=True, help="Avoid resuming unfinished download."
 )
+@click.option(
+    "-j",
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=DEFAULT_CONCURRENCY,
+    show_default=True,
+    help="Number of segments of each stream to download at once.",
+)
 @cache_options
 @keep_temp_option
 @stream_argument
@@ -223,6 +315,7 @@ def download_command(
     dry_run: bool,
     yt_dlp: bool,
     ignore_resume: bool,
+    concurrency: int,
     no_cache: bool,
     force_update_cache: bool,
     keep_temp: bool,
@@ -294,27 +387,34 @@ def download_command(
 
     reference_stream = video_stream or audio_stream
     reference_base_url = reference_stream.base_url
-    head_sequence = request_reference_sequence(reference_base_url, playback.session)
+    # The head sequence number is only needed for relative and sequence bounds.
+    get_head_sequence = cache(
+        partial(request_reference_sequence, reference_base_url, playback.session)
+    )
 
     requested_start, requested_end = resolve_relativity_in_interval(*interval)
 
     if requested_start == "earliest":
         head_date = datetime.now(timezone.utc)
-        requested_start = find_earliest_sequence(playback, head_sequence, head_date)
+        requested_start = find_earliest_sequence(
+            playback, get_head_sequence(), head_date
+        )
 
     if isinstance(requested_start, SegmentSequence):
         raise_for_too_far_sequence(
-            requested_start, head_sequence, reference_base_url, ctx, "interval"
+            requested_start, get_head_sequence(), reference_base_url, ctx, "interval"
         )
         raise_for_sequence_ahead_of_current(
-            requested_start, head_sequence, ctx, "interval"
+            requested_start, get_head_sequence(), ctx, "interval"
         )
 
     match requested_end:
         case SegmentSequence() as x:
-            raise_for_sequence_ahead_of_current(x, head_sequence, ctx, "interval")
+            raise_for_sequence_ahead_of_current(
+                x, get_head_sequence(), ctx, "interval"
+            )
         case "now":
-            requested_end = head_sequence - 1
+            requested_end = get_head_sequence() - 1
 
     preview_mode = preview_start or preview_end
     if not preview_mode and (requested_start == ".." or requested_end == ".."):
@@ -355,23 +455,31 @@ def download_command(
 
     resume_run: bool = False
     resume_file_path = Path.cwd() / compose_resume_filename(
-        playback.video_id, (audio_stream, video_stream)
+        playback.video_id,
+        (audio_stream, video_stream),
+        ctx.meta[RAW_INTERVAL_META_KEY],
     )
 
     if not ignore_resume and resume_file_path.exists():
         logger.debug("Load resume file from %s", resume_file_path)
-        with open(resume_file_path, "rb") as f:
+        if resume_file_content := _read_resume_file(resume_file_path):
             resume_run = True
-            pickled = pickle.load(f)
-            rewind_interval = pickled["interval"]
-            previous_segments_output_directory = Path.absolute(
-                pickled["segments_output_directory"]
-            )
+            resume_state, rewind_interval = resume_file_content
+            previous_segments_output_directory = Path(
+                resume_state["segments_output_directory"]
+            ).absolute()
+            previous_segments_directory_created = resume_state[
+                "segments_output_directory_created"
+            ]
+        else:
+            logger.debug("Skip resume file with unsupported schema")
 
     if not resume_run:
         try:
             # assert False, requested_start
-            rewind_interval = playback.locate_interval(
+            rewind_interval = locate_interval_with_cache(
+                ctx,
+                playback,
                 requested_start,
                 requested_end,
                 reference_stream,
@@ -411,10 +519,9 @@ def download_command(
             )
         )
 
-    start_segment = playback.get_segment(
-        rewind_interval.start.sequence, reference_stream
+    start_segment, end_segment = get_boundary_segments(
+        playback, rewind_interval, reference_stream
     )
-    end_segment = playback.get_segment(rewind_interval.end.sequence, reference_stream)
 
     requested_start_date: datetime
     match requested_start:
@@ -460,6 +567,11 @@ def download_command(
     if dry_run:
         echo_notice("This is a dry run. Skip downloading and exit.")
     else:
+        # Imported here, since dumps and dry runs exit before downloading, and
+        # these modules pull in Rich progress, PIL, and FFmpeg helpers.
+        from ytpb import actions
+        from ytpb.merge import merge_segments
+
         # Absolute output path of an excerpt without extension.
         final_output_path: Path
 
@@ -513,23 +625,31 @@ def download_command(
             )
             click.echo()
             if segments_output_directory != previous_segments_output_directory:
+                previous_directory_to_show = try_get_relative_path(
+                    previous_segments_output_directory
+                )
                 click.echo(
                     "fatal: The previous segments output directory is not "
                     "the same as the current run:\n'{}' != '{}'.".format(
-                        try_get_relative_path(previous_segments_output_directory),
+                        previous_directory_to_show,
                         try_get_relative_path(segments_output_directory),
                     ),
                     err=True,
                 )
                 click.echo(
                     "\nUse '--segments-output-dir {}' or '--ignore-resume'.".format(
-                        try_get_relative_path(previous_segments_output_directory)
+                        previous_directory_to_show
                     ),
                     err=True,
                 )
                 sys.exit(1)
 
-        if segments_output_dir_option is None or not segments_output_directory.exists():
+        if resume_run:
+            # The directory exists now anyway, so rely on the unfinished run.
+            segments_directory_created = previous_segments_directory_created
+        else:
+            segments_directory_created = not segments_output_directory.exists()
+        if segments_output_dir_option is None or segments_directory_created:
             need_to_remove_segments_directory = True
             segments_directory_to_remove = segments_output_directory
             for directory in segments_output_directory.parents:
@@ -541,24 +661,23 @@ def download_command(
             need_to_remove_segments_directory = False
 
         if not resume_run and not preview_mode:
-            with open(resume_file_path, "wb") as f:
-                logger.debug("Write resume file to %s", resume_file_path)
-                to_pickle = {
-                    "interval": rewind_interval,
-                    "segments_output_directory": segments_output_directory,
-                }
-                pickle.dump(to_pickle, f)
+            logger.debug("Write resume file to %s", resume_file_path)
+            _write_resume_file(
+                resume_file_path,
+                {
+                    "schema_version": RESUME_FILE_SCHEMA_VERSION,
+                    "interval": rewind_interval.to_dict(),
+                    "segments_output_directory": str(segments_output_directory),
+                    "segments_output_directory_created": segments_directory_created,
+                },
+            )
 
         if resume_run:
-            extract_sequence_number = lambda p: int(p.name.split(".")[0])
-            latest_sequence_number = extract_sequence_number(
-                sorted(
-                    segments_output_directory.glob(
-                        f"*.i{(audio_stream or video_stream).itag}*"
-                    ),
-                    key=extract_sequence_number,
-                )[-1]
+            latest_sequence_number = _find_latest_downloaded_sequence(
+                segments_output_directory, (audio_stream or video_stream).itag
             )
+            if latest_sequence_number is None:
+                latest_sequence_number = rewind_interval.start.sequence
             sequences_to_download = range(
                 latest_sequence_number, rewind_interval.end.sequence + 1
             )
@@ -579,13 +698,19 @@ def download_command(
                 "   - Video", total=total_segments, completed=completed_segments
             )
 
+        streams_to_download = [x for x in [audio_stream, video_stream] if x]
+        # Every stream is downloaded with its own pool of workers, so keep
+        # enough connections alive for all of them.
+        playback.session.resize_pool(concurrency * len(streams_to_download))
+
         do_download_segments = partial(
             actions.download.download_segments,
             playback=playback,
             sequence_numbers=sequences_to_download,
-            streams=[x for x in [audio_stream, video_stream] if x is not None],
+            streams=streams_to_download,
             output_directory=segments_output_directory,
             progress_reporter=progress_reporter,
+            max_workers=concurrency,
         )
 
         if no_merge:
@@ -608,20 +733,31 @@ def download_command(
                 )
             )
 
-            do_download_segments()
-            audio_and_video_segment_paths: list[list[Path]] = [[], []]
-            if audio_stream:
-                audio_and_video_segment_paths[0] = [
-                    segments_output_directory
-                    / compose_default_segment_filename(sequence, audio_stream.base_url)
-                    for sequence in rewind_interval.sequences
-                ]
-            if video_stream:
-                audio_and_video_segment_paths[1] = [
-                    segments_output_directory
-                    / compose_default_segment_filename(sequence, video_stream.base_url)
-                    for sequence in rewind_interval.sequences
+            downloaded_paths = iter(do_download_segments())
+            audio_and_video_segment_paths: list[list[str | Path]] = [[], []]
+            if resume_run:
+                # Only the remaining segments have been downloaded now. Paths
+                # are kept as plain strings: they are only written to FFmpeg
+                # concat files and unlinked, so there is no need to pay for
+                # creating a Path object per segment.
+                base_urls_and_paths = [
+                    (stream.base_url, paths)
+                    for stream, paths in zip(
+                        (audio_stream, video_stream), audio_and_video_segment_paths
+                    )
+                    if stream
                 ]
+                segments_directory_prefix = f"{segments_output_directory}{os.sep}"
+                for sequence in rewind_interval.sequences:
+                    for base_url, paths in base_urls_and_paths:
+                        paths.append(
+                            segments_directory_prefix
+                            + compose_default_segment_filename(sequence, base_url)
+                        )
+            else:
+                for i, stream in enumerate((audio_stream, video_stream)):
+                    if stream:
+                        audio_and_video_segment_paths[i] = next(downloaded_paths)
 
             if cut:
                 click.echo("2. Merging segments (cut requested)... ", nl=False)
@@ -631,8 +767,8 @@ def download_command(
             if not no_metadata:
 
                 def _convert_date_to_isostring(date: datetime) -> str:
-                    iso_date = date.astimezone(timezone.utc)
-                    return iso_date.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+                    iso_date = date.astimezone(timezone.utc).replace(tzinfo=None)
+                    return f"{iso_date.isoformat(timespec='microseconds')}Z"
 
                 metadata_date_converter: Callable[[datetime], str]
                 match ctx.obj.config.traverse("output.metadata.dates"):
@@ -703,21 +839,35 @@ def download_command(
         resume_file_path.unlink()
 
     if not (dry_run or keep_segments or preview_mode):
-        try:
-            for paths in audio_and_video_segment_paths:
-                for path in paths:
-                    path.unlink()
-        except OSError:
-            logger.warning("Could not remove segment: %s", path)
+        # A directory created for this run (or by the resumed run) is removed
+        # with all segments at once, unless the excerpt itself has been saved
+        # into it. An already existing directory may hold other files, so
+        # only the segments are removed from it, and it is removed only if
+        # nothing else is left.
+        remove_segments_at_once = (
+            need_to_remove_segments_directory
+            and segments_directory_created
+            and not merged_path.is_relative_to(segments_output_directory)
+        )
+        if not remove_segments_at_once:
+            _remove_segments(chain.from_iterable(audio_and_video_segment_paths))
         try:
             if need_to_remove_segments_directory:
                 logger.debug(
                     "Remove segments directory: %s",
                     segments_directory_to_remove,
                 )
-                remove_directories_between(
-                    segments_directory_to_remove, segments_output_directory
-                )
+                if remove_segments_at_once:
+                    shutil.rmtree(segments_output_directory)
+                    if segments_directory_to_remove != segments_output_directory:
+                        remove_directories_between(
+                            segments_directory_to_remove,
+                            segments_output_directory.parent,
+                        )
+                elif not any(segments_output_directory.iterdir()):
+                    remove_directories_between(
+                        segments_directory_to_remove, segments_output_directory
+                    )
         except OSError:
             logger.warning(
                 "Could not remove segments directory: %s",
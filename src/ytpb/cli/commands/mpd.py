@@ -15,6 +15,7 @@ from ytpb.actions.compose import compose_static_mpd, refresh_mpd
 from ytpb.cli.common import (
     CONSOLE_TEXT_WIDTH,
     create_playback,
+    get_boundary_segments,
     print_summary_info,
     query_streams_or_exit,
     raise_for_sequence_ahead_of_current,
@@ -196,10 +197,9 @@ def compose_command(
     )
     click.echo("done.")
 
-    start_segment = playback.get_segment(
-        rewind_interval.start.sequence, reference_stream
+    start_segment, end_segment = get_boundary_segments(
+        playback, rewind_interval, reference_stream
     )
-    end_segment = playback.get_segment(rewind_interval.end.sequence, reference_stream)
 
     requested_start_date: datetime
     match requested_start:
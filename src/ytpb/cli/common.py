@@ -1,13 +1,17 @@
 import email
+import hashlib
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
 
 import click
 import cloup
 import structlog
 
+from ytpb.cache import read_from_cache, write_to_cache
 from ytpb.cli.utils.date import format_timedelta, round_date
 
 from ytpb.errors import (
@@ -23,7 +27,14 @@ from ytpb.fetchers import YoutubeDLInfoFetcher, YtpbInfoFetcher
 from ytpb.format_spec import query_items
 from ytpb.info import BroadcastStatus
 from ytpb.playback import Playback, RewindInterval
-from ytpb.types import DateInterval, SegmentSequence, SetOfStreams
+from ytpb.segment import Segment
+from ytpb.types import (
+    AudioOrVideoStream,
+    DateInterval,
+    PointInStream,
+    SegmentSequence,
+    SetOfStreams,
+)
 from ytpb.utils.url import extract_parameter_from_url, normalize_video_url
 
 logger = structlog.getLogger(__name__)
@@ -163,6 +174,67 @@ def create_playback(ctx: click.Context) -> Playback:
     return playback
 
 
+def locate_interval_with_cache(
+    ctx: click.Context,
+    playback: Playback,
+    start_point: PointInStream,
+    end_point: PointInStream,
+    stream: AudioOrVideoStream,
+) -> RewindInterval:
+    """Locates an interval, reusing the result of a previous run if cached.
+
+    Segment sequence numbers and dates of a stream do not change, so the same
+    requested points are located to the same interval. The cache is bypassed
+    with the ``--no-cache`` and ``--force-update-cache`` options.
+    """
+    # Types are part of the key: a relative sequence is an int subclass and
+    # would otherwise be indistinguishable from an absolute one.
+    points_key = tuple(
+        (type(point).__name__, str(point)) for point in (start_point, end_point)
+    )
+    points_digest = hashlib.blake2b(
+        repr((points_key, stream.itag)).encode(), digest_size=8
+    ).hexdigest()
+    cache_key = f"{playback.video_id}-{points_digest}"
+    cache_directory = Playback.get_cache_directory()
+
+    force_update_cache = ctx.params.get("force_update_cache", False)
+    no_cache = ctx.params.get("no_cache", True)
+    if not (no_cache or force_update_cache):
+        if cached_item := read_from_cache(cache_key, cache_directory):
+            logger.debug("Use located interval from cache")
+            return RewindInterval.from_dict(cached_item["interval"])
+
+    rewind_interval = playback.locate_interval(start_point, end_point, stream)
+
+    if not no_cache:
+        expires_at = extract_parameter_from_url("expire", stream.base_url)
+        item_to_cache = {"interval": rewind_interval.to_dict()}
+        write_to_cache(cache_key, expires_at, item_to_cache, cache_directory)
+
+    return rewind_interval
+
+
+def get_boundary_segments(
+    playback: Playback, interval: RewindInterval, stream: AudioOrVideoStream
+) -> tuple[Segment, Segment]:
+    """Gets start and end segments of an interval, requesting them concurrently."""
+    if interval.start.sequence == interval.end.sequence:
+        segment = playback.get_segment(interval.start.sequence, stream)
+        return segment, segment
+    # Resolve the temporary directory here to not create it in both threads.
+    get_segment = partial(
+        playback.get_segment,
+        stream=stream,
+        segment_directory=playback.get_temp_directory(),
+    )
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        start_segment, end_segment = executor.map(
+            get_segment, (interval.start.sequence, interval.end.sequence)
+        )
+    return start_segment, end_segment
+
+
 def query_streams_or_exit(
     streams: SetOfStreams,
     format_spec: str,
@@ -12,6 +12,9 @@ from ytpb.types import AbsolutePointInStream, SegmentSequence
 
 logger = structlog.get_logger(__name__)
 
+#: A key of :attr:`click.Context.meta` to store the original interval value.
+RAW_INTERVAL_META_KEY = "ytpb.raw_interval"
+
 
 class PointInStreamParamType(click.ParamType):
     def __init__(self, allowed_literals: list[str] | None = None):
@@ -193,6 +196,10 @@ class RewindIntervalParamType(click.ParamType):
                 f"Start is ahead or equal to end: {start} >= {end}"
             )
 
+        if ctx is not None:
+            # Keep the value as it was given, e.g. to compose resume filenames.
+            ctx.meta[RAW_INTERVAL_META_KEY] = value
+
         return start, end
 
 
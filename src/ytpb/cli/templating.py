@@ -41,7 +41,10 @@ class IntervalOutputPathContext(TypedDict):
 
 
 def check_is_template(value: str) -> bool:
-    return any([delimiter in value for delimiter in ("{#", "{{", "{%")])
+    # All delimiters start with '{', so most literal paths are rejected at once.
+    if "{" not in value:
+        return False
+    return any(delimiter in value for delimiter in ("{#", "{{", "{%"))
 
 
 def render_template(
@@ -2,6 +2,9 @@
 
 import io
 import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Generator
 from urllib.parse import urljoin
@@ -17,12 +20,16 @@ logger = structlog.get_logger(__name__)
 
 SegmentOutputFilename = str | Callable[[SegmentSequence, str], str]
 
+#: A size of chunks (in bytes) to write streamed segments to files with.
+DOWNLOAD_CHUNK_SIZE = 128 * 1024
+
 
 def _request_segment(
     sequence: SegmentSequence,
     base_url: str,
     size: int | None = None,
     session: requests.Session | None = None,
+    stream: bool = False,
 ) -> requests.Response:
     get_function = session.get if session else requests.get
 
@@ -30,7 +37,9 @@ def _request_segment(
     if size:
         headers["Range"] = f"bytes=0-{size}"
 
-    response = get_function(urljoin(base_url, f"sq/{sequence}"), headers=headers)
+    response = get_function(
+        urljoin(base_url, f"sq/{sequence}"), headers=headers, stream=stream
+    )
 
     try:
         response.raise_for_status()
@@ -47,10 +56,15 @@ def _request_segment(
     return response
 
 
-def compose_default_segment_filename(sequence: SegmentSequence, base_url: str) -> str:
+@lru_cache(maxsize=16)
+def _compose_segment_filename_suffix(base_url: str) -> str:
     itag = extract_parameter_from_url("itag", base_url)
     extension = extract_media_type_from_url(base_url)[1]
-    return f"{sequence}.i{itag}.{extension}"
+    return f".i{itag}.{extension}"
+
+
+def compose_default_segment_filename(sequence: SegmentSequence, base_url: str) -> str:
+    return f"{sequence}{_compose_segment_filename_suffix(base_url)}"
 
 
 def save_segment_to_file(
@@ -105,9 +119,10 @@ def download_segment(
         path_to_download_to = Path(output_directory) / output_filename
 
     if force_download or not os.path.isfile(path_to_download_to):
-        with open(path_to_download_to, "wb") as f:
-            response = _request_segment(sequence, base_url, size, session)
-            f.write(response.content)
+        response = _request_segment(sequence, base_url, size, session, stream=True)
+        with response, open(path_to_download_to, "wb") as f:
+            for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
 
     return path_to_download_to
 
@@ -141,19 +156,47 @@ def iter_segments(
     base_url: str,
     size: int | None = None,
     session: requests.Session | None = None,
+    max_workers: int = 1,
 ) -> Generator[tuple[requests.Response, SegmentSequence, str], None, None]:
     """Iterates over segment sequence numbers and requests segments.
 
+    With ``max_workers`` greater than one, segments are requested concurrently
+    in a thread pool, but yielded in the order of sequence numbers. The number
+    of requested but not yet yielded segments is bounded to keep memory usage
+    low.
+
     Args:
         sequences: Segment sequence numbers.
         base_url: A segment base URL.
         size: An amount of bytes to download.
         session: A :class:`requests.Session` object.
+        max_workers: A number of segments to request concurrently.
 
     Yields:
         Tuples of a :class:`requests.Response` object, segment sequence number,
         and base URL.
     """
-    for sequence in sequences:
-        with _request_segment(sequence, base_url, size, session) as response:
-            yield response, sequence, base_url
+    if max_workers <= 1:
+        for sequence in sequences:
+            with _request_segment(sequence, base_url, size, session) as response:
+                yield response, sequence, base_url
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending: deque[tuple[Future, SegmentSequence]] = deque()
+    try:
+        for sequence in sequences:
+            future = executor.submit(
+                _request_segment, sequence, base_url, size, session
+            )
+            pending.append((future, sequence))
+            if len(pending) >= 2 * max_workers:
+                future, pending_sequence = pending.popleft()
+                with future.result() as response:
+                    yield response, pending_sequence, base_url
+        while pending:
+            future, pending_sequence = pending.popleft()
+            with future.result() as response:
+                yield response, pending_sequence, base_url
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -7,7 +7,6 @@ from abc import ABC, abstractmethod
 
 import requests
 import structlog
-from yt_dlp import DownloadError, YoutubeDL
 
 from ytpb.errors import BroadcastStatusError
 from ytpb.info import BroadcastStatus, extract_video_info, YouTubeVideoInfo
@@ -111,11 +110,17 @@ class YoutubeDLInfoFetcher(InfoFetcher):
             session: A :class:`requests.Session` object.
             options: Options passed to :class:`yt_dlp.YoutubeDL`.
         """
+        # Imported here, since yt-dlp takes a while to import and is only
+        # needed when this fetcher is used.
+        from yt_dlp import YoutubeDL
+
         super().__init__(video_url, session)
         self._ydl = YoutubeDL(self.default_options | (options or {}))
         self._formats: list[dict] = []
 
     def fetch_video_info(self) -> YouTubeVideoInfo:
+        from yt_dlp import DownloadError
+
         try:
             extracted = self._ydl.extract_info(self.video_url, download=False)
         except DownloadError as exc:
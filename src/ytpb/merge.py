@@ -10,6 +10,7 @@ Note:
 import functools
 import os
 import shlex
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
@@ -133,10 +134,8 @@ def _compose_concat_file(segment_paths, temp_directory, suffix: str = ""):
     else:
         concat_file_path = Path(temp_directory, "concat")
 
-    concat_file_lines = [f"file '{path}'\n" for path in segment_paths]
-
     with open(concat_file_path, "w") as f:
-        f.writelines(concat_file_lines)
+        f.writelines(f"file '{path}'\n" for path in segment_paths)
 
     return concat_file_path
 
@@ -157,8 +156,8 @@ def ensure_cleanup_if_needed(f):
 
 @ensure_cleanup_if_needed
 def merge_segments(
-    audio_segment_paths: list[Path] | None = None,
-    video_segment_paths: list[Path] | None = None,
+    audio_segment_paths: list[str | Path] | None = None,
+    video_segment_paths: list[str | Path] | None = None,
     output_directory: str | Path | None = None,
     output_stem: str | Path | None = None,
     temp_directory: str | Path | None = None,
@@ -302,12 +301,13 @@ def merge_segments(
                 cut_at_end=cut_at_end,
             )
 
-            bounds_slice = slice(1, -1)
+            # Middle segments, without copying the lists of paths.
+            middle_segment_paths = lambda paths: islice(paths, 1, len(paths) - 1)
             concat_filter_options = []
 
             if video_segment_paths:
                 concat_file_path = _compose_concat_file(
-                    video_segment_paths[bounds_slice],
+                    middle_segment_paths(video_segment_paths),
                     temp_directory,
                     suffix="video",
                 )
@@ -316,7 +316,7 @@ def merge_segments(
 
             if audio_segment_paths:
                 concat_file_path = _compose_concat_file(
-                    audio_segment_paths[bounds_slice],
+                    middle_segment_paths(audio_segment_paths),
                     temp_directory,
                     suffix="audio",
                 )
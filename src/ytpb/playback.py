@@ -3,6 +3,8 @@
 import operator
 import re
 import tempfile
+import threading
+from collections import OrderedDict
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -10,6 +12,7 @@ from typing import Iterable, Self, TypedDict, TypeGuard, Unpack
 from urllib.parse import parse_qs, urlparse
 
 import requests
+import requests.adapters
 import structlog
 from platformdirs import user_cache_path
 
@@ -156,6 +159,22 @@ class RewindInterval:
         """Segment sequence numbers that represent the interval."""
         return range(self.start.sequence, self.end.sequence + 1)
 
+    def to_dict(self) -> dict:
+        """Converts the interval to a JSON-serializable dictionary."""
+        output = asdict(self)
+        for moment in output.values():
+            moment["date"] = moment["date"].isoformat()
+        return output
+
+    @classmethod
+    def from_dict(cls, value: dict) -> "RewindInterval":
+        """Creates an interval from a dictionary made by :meth:`to_dict`."""
+        start, end = (
+            RewindMoment(**{**moment, "date": datetime.fromisoformat(moment["date"])})
+            for moment in (value["start"], value["end"])
+        )
+        return cls(start, end)
+
 
 class PlaybackSession(requests.Session):
     """A session to use with :class:`Playback`.
@@ -165,34 +184,72 @@ class PlaybackSession(requests.Session):
 
     - 403: Refresh segment base URL, and repeat a request
     - 404: Retry a request with no change
+
+    The connection pool is sized to keep connections alive when segments are
+    downloaded concurrently, see :attr:`pool_maxsize`. Base URLs are refreshed
+    only once when several concurrent requests fail with 403.
     """
 
     max_retries: int = 3
+    #: A maximum number of connections to keep alive per host.
+    pool_maxsize: int = 16
 
     def __init__(self, playback: "Playback" = None, **kwargs):
         super().__init__(**kwargs)
 
         self.playback = playback
         self.hooks["response"].append(self._handle_http_errors)
+        self._refresh_lock = threading.Lock()
+        # Maps expired base URLs to the refreshed ones.
+        self._refreshed_base_urls: dict[str, str] = {}
+        self._mount_adapter()
+
+    def _mount_adapter(self) -> None:
+        self.mount(
+            "https://", requests.adapters.HTTPAdapter(pool_maxsize=self.pool_maxsize)
+        )
 
     def set_playback(self, playback):
         self.playback = playback
 
-    def _handle_403_error(self, request: requests.Request) -> None:
-        old_corresponding_stream = next(
-            iter(
-                self.playback.streams.filter(
-                    lambda x: request.url.startswith(x.base_url)
-                )
-            )
-        )
-        old_base_url = old_corresponding_stream.base_url
+    def resize_pool(self, maxsize: int) -> None:
+        """Resizes the connection pool to keep up to ``maxsize`` connections.
 
+        The pool is never shrunk below its current size.
+        """
+        if maxsize <= self.pool_maxsize:
+            return
+        self.pool_maxsize = maxsize
+        self.adapters["https://"].close()
+        self._mount_adapter()
+
+    def _refresh_base_urls(self) -> None:
+        old_base_urls = {s.itag: s.base_url for s in self.playback.streams}
         self.playback.fetch_and_set_essential()
-        new_corresponding_stream = self.playback.streams.get_by_itag(
-            old_corresponding_stream.itag
-        )
-        new_base_url = new_corresponding_stream.base_url
+        for stream in self.playback.streams:
+            old_base_url = old_base_urls.get(stream.itag)
+            if old_base_url and old_base_url != stream.base_url:
+                self._refreshed_base_urls[old_base_url] = stream.base_url
+
+    def _handle_403_error(self, request: requests.Request) -> None:
+        with self._refresh_lock:
+            # Base URLs could be already refreshed by another thread while
+            # this request was in flight.
+            old_base_url = next(
+                (x for x in self._refreshed_base_urls if request.url.startswith(x)),
+                None,
+            )
+            if old_base_url is None:
+                old_corresponding_stream = next(
+                    iter(
+                        self.playback.streams.filter(
+                            lambda x: request.url.startswith(x.base_url)
+                        )
+                    )
+                )
+                old_base_url = old_corresponding_stream.base_url
+                self._refresh_base_urls()
+            new_base_url = self._refreshed_base_urls.get(old_base_url, old_base_url)
 
         request.url = request.url.replace(old_base_url, new_base_url)
 
@@ -237,6 +294,9 @@ class _PlaybackOptions(TypedDict, total=False):
 class Playback:
     """The playback for live streams."""
 
+    #: A maximum number of parsed segments to keep, see :meth:`get_segment`.
+    segments_cache_maxsize: int = 4
+
     def __init__(
         self,
         video_url: str,
@@ -275,6 +335,8 @@ class Playback:
         self._streams: SetOfStreams | None = None
         self._temp_directory: Path | None = None
         self._cache_directory: Path | None = None
+        self._segments: OrderedDict[Path, Segment] = OrderedDict()
+        self._segments_lock = threading.Lock()
 
         self.rewind_history = RewindTreeMap()
 
@@ -534,6 +596,15 @@ class Playback:
         else:
             segment_path = segment_directory / segment_filename
 
+        # Recently used segments are not read and parsed again. For example,
+        # boundary segments of an interval are requested again after locating.
+        with self._segments_lock:
+            if cached_segment := self._segments.get(segment_path):
+                if segment_path.exists():
+                    self._segments.move_to_end(segment_path)
+                    return cached_segment
+                del self._segments[segment_path]
+
         try:
             segment = Segment.from_file(segment_path)
         except FileNotFoundError as exc:
@@ -546,6 +617,13 @@ class Playback:
                     "and the same segment filename is used"
                 )
                 raise
+
+        with self._segments_lock:
+            self._segments[segment_path] = segment
+            self._segments.move_to_end(segment_path)
+            if len(self._segments) > self.segments_cache_maxsize:
+                self._segments.popitem(last=False)
+
         return segment
 
     def locate_moment(
@@ -581,7 +659,7 @@ class Playback:
 
         match point:
             case SegmentSequence() as sequence:
-                segment = Segment.from_file(self.download_segment(sequence, stream))
+                segment = self.get_segment(sequence, stream)
                 date = _get_non_located_date(segment)
                 moment = RewindMoment(date, sequence, 0, is_end)
             case datetime() as date:
@@ -1,5 +1,6 @@
 import re
 import time
+from functools import lru_cache
 from urllib.parse import parse_qs, urlparse
 
 from ytpb.errors import BadCommandArgument
@@ -25,7 +26,10 @@ def normalize_video_url(video_url_or_id: str) -> str:
     return video_url
 
 
+@lru_cache(maxsize=128)
 def extract_parameter_from_url(parameter: str, url: str) -> str:
+    # Base URLs are long and the same parameters are extracted from them over
+    # and over again, so the results are cached.
     url_path_parts = urlparse(url).path.split("/")
     try:
         value_index = url_path_parts.index(parameter)
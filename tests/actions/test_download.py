@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable
+from unittest.mock import patch
 from urllib.parse import urljoin
 
 from ytpb import actions
@@ -132,6 +133,41 @@ def test_download_audio_excerpt_with_cutting(
     assert_approx_duration(output_result[1], 3)
 
 
+def test_download_excerpt_forwards_max_workers(
+    fake_info_fetcher: "FakeInfoFetcher",
+    add_responses_callback_for_segment_urls: Callable,
+    stream_url: str,
+    audio_base_url: str,
+    run_temp_directory: Path,
+    tmp_path: Path,
+) -> None:
+    # Given:
+    add_responses_callback_for_segment_urls(urljoin(audio_base_url, r"sq/\w+"))
+
+    # When:
+    playback = Playback(stream_url, fetcher=fake_info_fetcher)
+    playback.fetch_and_set_essential()
+    with patch(
+        "ytpb.actions.download.download_segments",
+        wraps=actions.download.download_segments,
+    ) as mock_download_segments:
+        actions.download.download_excerpt(
+            playback,
+            rewind_interval=FakeRewindInterval(
+                FakeRewindMoment(7959120), FakeRewindMoment(7959122)
+            ),
+            output_stem=tmp_path / "output",
+            audio_stream=FakeStream(audio_base_url),
+            segments_directory=tmp_path / "segments",
+            need_cut=False,
+            max_workers=2,
+        )
+
+    # Then:
+    mock_download_segments.assert_called_once()
+    assert mock_download_segments.call_args.kwargs["max_workers"] == 2
+
+
 def test_download_audio_and_video_excerpt_without_cutting(
     fake_info_fetcher: "FakeInfoFetcher",
     add_responses_callback_for_segment_urls: Callable,
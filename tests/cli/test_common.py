@@ -0,0 +1,38 @@
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+from freezegun import freeze_time
+
+from ytpb.cli.common import locate_interval_with_cache
+from ytpb.playback import RewindInterval, RewindMoment
+from ytpb.types import RelativeSegmentSequence
+
+
+def _create_interval(start: int, end: int) -> RewindInterval:
+    date = datetime(2023, 9, 28, tzinfo=timezone.utc)
+    return RewindInterval(
+        RewindMoment(date, start, 0), RewindMoment(date, end, 0, is_end=True)
+    )
+
+
+@freeze_time("2023-09-28T00:00:00+00:00")
+def test_locate_relative_and_absolute_intervals_with_cache(
+    audio_base_url: str,
+) -> None:
+    # Given:
+    ctx = MagicMock(params={"no_cache": False})
+    stream = MagicMock(itag="140", base_url=audio_base_url)
+    playback = MagicMock(video_id="kHwmzef842g")
+    absolute_interval = _create_interval(10, 20)
+    relative_interval = _create_interval(30, 40)
+    playback.locate_interval.side_effect = [absolute_interval, relative_interval]
+
+    # When:
+    locate_interval_with_cache(ctx, playback, 10, 20, stream)
+    located_interval = locate_interval_with_cache(
+        ctx, playback, RelativeSegmentSequence(10), 20, stream
+    )
+
+    # Then:
+    assert located_interval == relative_interval
+    assert playback.locate_interval.call_count == 2
@@ -1,4 +1,5 @@
 import glob
+import json
 import os
 import pickle
 import platform
@@ -19,6 +20,7 @@ import toml
 
 from freezegun import freeze_time
 
+from ytpb import actions
 from ytpb.cli.config import DEFAULT_CONFIG
 from ytpb.playback import RewindInterval, RewindMoment
 
@@ -610,6 +612,104 @@ def test_no_merge_option(
     assert not os.path.exists(run_temp_directory)
 
 
+@freeze_time("2023-03-26T00:00:00+00:00")
+def test_concurrency_option(
+    ytpb_cli_invoke: Callable,
+    add_responses_callback_for_reference_base_url: Callable,
+    add_responses_callback_for_segment_urls: Callable,
+    fake_info_fetcher: MagicMock,
+    stream_url: str,
+    audio_base_url: str,
+    tmp_path: Path,
+) -> None:
+    # Given:
+    add_responses_callback_for_reference_base_url()
+    add_responses_callback_for_segment_urls(
+        urljoin(audio_base_url, r"sq/\w+"),
+    )
+
+    # When:
+    with (
+        patch("ytpb.cli.common.YtpbInfoFetcher") as mock_fetcher,
+        patch(
+            "ytpb.actions.download.download_segments",
+            wraps=actions.download.download_segments,
+        ) as mock_download_segments,
+    ):
+        mock_fetcher.return_value = fake_info_fetcher
+        result = ytpb_cli_invoke(
+            [
+                "--no-config",
+                "download",
+                "--no-cache",
+                "--interval",
+                "7959120/7959122",
+                "-af",
+                "itag eq 140",
+                "-vf",
+                "none",
+                "--concurrency",
+                "2",
+                stream_url,
+            ],
+            catch_exceptions=False,
+        )
+
+    # Then:
+    assert result.exit_code == 0
+    mock_download_segments.assert_called_once()
+    assert mock_download_segments.call_args.kwargs["max_workers"] == 2
+
+
+@freeze_time("2023-03-26T00:00:00+00:00")
+def test_concurrency_option_sizes_connection_pool(
+    ytpb_cli_invoke: Callable,
+    add_responses_callback_for_reference_base_url: Callable,
+    add_responses_callback_for_segment_urls: Callable,
+    fake_info_fetcher: MagicMock,
+    stream_url: str,
+    audio_base_url: str,
+    tmp_path: Path,
+) -> None:
+    # Given:
+    add_responses_callback_for_reference_base_url()
+    add_responses_callback_for_segment_urls(
+        urljoin(audio_base_url, r"sq/\w+"),
+    )
+
+    # When:
+    with (
+        patch("ytpb.cli.common.YtpbInfoFetcher") as mock_fetcher,
+        patch(
+            "ytpb.actions.download.download_segments",
+            wraps=actions.download.download_segments,
+        ) as mock_download_segments,
+    ):
+        mock_fetcher.return_value = fake_info_fetcher
+        result = ytpb_cli_invoke(
+            [
+                "--no-config",
+                "download",
+                "--no-cache",
+                "--interval",
+                "7959120/7959122",
+                "-af",
+                "itag eq 140",
+                "-vf",
+                "none",
+                "--concurrency",
+                "32",
+                stream_url,
+            ],
+            catch_exceptions=False,
+        )
+
+    # Then:
+    assert result.exit_code == 0
+    playback = mock_download_segments.call_args.kwargs["playback"]
+    assert playback.session.pool_maxsize == 32
+
+
 @pytest.mark.expect_suffix(platform.system())
 @freeze_time("2023-03-26T00:00:00+00:00")
 def test_dry_run_option(
@@ -817,6 +917,55 @@ def test_from_empty_cache(
     assert os.path.exists(expected_path)
 
 
+@freeze_time("2023-03-26T00:00:00+00:00")
+def test_reuse_located_interval_from_cache(
+    ytpb_cli_invoke: Callable,
+    add_responses_callback_for_reference_base_url: Callable,
+    add_responses_callback_for_segment_urls: Callable,
+    fake_info_fetcher: MagicMock,
+    mocked_responses: responses.RequestsMock,
+    stream_url: str,
+    video_id: str,
+    audio_base_url: str,
+    tmp_path: Path,
+    run_temp_directory: Path,
+):
+    # Given:
+    add_responses_callback_for_reference_base_url()
+    add_responses_callback_for_segment_urls(
+        urljoin(audio_base_url, r"sq/\w+"),
+    )
+    args = [
+        "--no-config",
+        "download",
+        "--interval",
+        "2023-03-25T23:33:55+00/2023-03-25T23:33:57+00",
+        "-af",
+        "itag eq 140",
+        "-vf",
+        "none",
+        "--dry-run",
+        "--keep-temp",
+        stream_url,
+    ]
+
+    with patch("ytpb.cli.common.YtpbInfoFetcher") as mock_fetcher:
+        mock_fetcher.return_value = fake_info_fetcher
+        first_result = ytpb_cli_invoke(args, catch_exceptions=False)
+        first_run_calls = len(mocked_responses.calls)
+
+        # When:
+        second_result = ytpb_cli_invoke(args, catch_exceptions=False)
+        second_run_calls = len(mocked_responses.calls) - first_run_calls
+
+    # Then:
+    assert first_result.exit_code == second_result.exit_code == 0
+    assert first_result.output == second_result.output
+    cache_directory = platformdirs.user_cache_path() / "ytpb"
+    assert len(list(cache_directory.glob(f"*~{video_id}-*"))) == 1
+    assert second_run_calls < first_run_calls
+
+
 @pytest.mark.parametrize(
     "audio_format,video_format",
     [
@@ -1686,10 +1835,11 @@ def test_resume_downloading(
     )
 
     resume_file_stem = f"{video_id}-7959120-20230325T233359+00-140"
-    with open(f"{resume_file_stem}.resume", "wb") as f:
+    with open(f"{resume_file_stem}.resume", "w") as f:
         end_date = datetime.fromisoformat("2023-03-25T23:33:59+00")
-        pickle.dump(
+        json.dump(
             {
+                "schema_version": 2,
                 "interval": RewindInterval(
                     start=RewindMoment(
                         date=datetime.fromtimestamp(1679787234.491176, timezone.utc),
@@ -1703,8 +1853,9 @@ def test_resume_downloading(
                         cut_at=0,
                         is_end=True,
                     ),
-                ),
-                "segments_output_directory": Path(f"{resume_file_stem}"),
+                ).to_dict(),
+                "segments_output_directory": f"{resume_file_stem}",
+                "segments_output_directory_created": True,
             },
             f,
         )
@@ -1747,6 +1898,124 @@ def test_resume_downloading(
     assert not os.path.exists(tmp_path / f"{resume_file_stem}")
 
 
+@freeze_time("2023-03-26T00:00:00+00:00")
+def test_keep_other_files_in_existing_segments_directory(
+    ytpb_cli_invoke: Callable,
+    add_responses_callback_for_reference_base_url: Callable,
+    add_responses_callback_for_segment_urls: Callable,
+    fake_info_fetcher: MagicMock,
+    video_id: str,
+    audio_base_url: str,
+    tmp_path: Path,
+) -> None:
+    # Given:
+    add_responses_callback_for_reference_base_url()
+    add_responses_callback_for_segment_urls(
+        urljoin(audio_base_url, r"sq/\w+"),
+    )
+
+    segments_output_directory = tmp_path / f"{video_id}-7959120-7959121-140"
+    segments_output_directory.mkdir()
+    (segments_output_directory / "other.txt").touch()
+
+    # When:
+    with patch("ytpb.cli.common.YtpbInfoFetcher") as mock_fetcher:
+        mock_fetcher.return_value = fake_info_fetcher
+        result = ytpb_cli_invoke(
+            [
+                "--no-config",
+                "download",
+                "--no-cache",
+                "--interval",
+                "7959120/7959121",
+                "-af",
+                "itag eq 140",
+                "-vf",
+                "none",
+                video_id,
+            ],
+            catch_exceptions=False,
+        )
+
+    # Then:
+    assert result.exit_code == 0
+    assert os.listdir(segments_output_directory) == ["other.txt"]
+
+
+@freeze_time("2023-03-26T00:00:00+00:00")
+def test_keep_other_files_in_existing_segments_directory_after_resume(
+    ytpb_cli_invoke: Callable,
+    add_responses_callback_for_reference_base_url: Callable,
+    add_responses_callback_for_segment_urls: Callable,
+    fake_info_fetcher: MagicMock,
+    video_id: str,
+    audio_base_url: str,
+    tmp_path: Path,
+) -> None:
+    # Given:
+    add_responses_callback_for_reference_base_url()
+    add_responses_callback_for_segment_urls(
+        urljoin(audio_base_url, r"sq/\w+"),
+    )
+
+    resume_file_stem = f"{video_id}-7959120-7959122-140"
+    with open(f"{resume_file_stem}.resume", "w") as f:
+        json.dump(
+            {
+                "schema_version": 2,
+                "interval": RewindInterval(
+                    start=RewindMoment(
+                        date=datetime.fromtimestamp(1679787234.491176, timezone.utc),
+                        sequence=7959120,
+                        cut_at=0,
+                        is_end=False,
+                    ),
+                    end=RewindMoment(
+                        date=datetime.fromtimestamp(1679787238.491916, timezone.utc),
+                        sequence=7959122,
+                        cut_at=0,
+                        is_end=True,
+                    ),
+                ).to_dict(),
+                "segments_output_directory": f"{resume_file_stem}",
+                "segments_output_directory_created": False,
+            },
+            f,
+        )
+    segments_output_directory = tmp_path / f"{resume_file_stem}"
+    segments_output_directory.mkdir()
+    (segments_output_directory / "other.txt").touch()
+    for segment in (7959120, 7959121):
+        shutil.copy(
+            TEST_DATA_PATH / f"segments/{segment}.i140.mp4",
+            segments_output_directory / f"{segment}.i140.mp4",
+        )
+
+    # When:
+    with patch("ytpb.cli.common.YtpbInfoFetcher") as mock_fetcher:
+        mock_fetcher.return_value = fake_info_fetcher
+        result = ytpb_cli_invoke(
+            [
+                "--no-config",
+                "download",
+                "--no-cache",
+                "--interval",
+                "7959120/7959122",
+                "-af",
+                "itag eq 140",
+                "-vf",
+                "none",
+                video_id,
+            ],
+            catch_exceptions=False,
+        )
+
+    # Then:
+    assert result.exit_code == 0
+    assert "~ Found unfinished download" in result.output
+    assert os.listdir(segments_output_directory) == ["other.txt"]
+
+
 @freeze_time("2023-03-26T00:00:00+00:00")
 def test_keep_segments(
     ytpb_cli_invoke: Callable,
@@ -2037,9 +2306,10 @@ def test_ignore_resume_option_after_unfinished_run(
     )
 
     resume_file_stem = f"{video_id}-7959120-7959122-140"
-    with open(f"{resume_file_stem}.resume", "wb") as f:
-        pickle.dump(
+    with open(f"{resume_file_stem}.resume", "w") as f:
+        json.dump(
             {
+                "schema_version": 2,
                 "interval": RewindInterval(
                     start=RewindMoment(
                         date=datetime.fromtimestamp(1679787234.491176, timezone.utc),
@@ -2053,8 +2323,9 @@ def test_ignore_resume_option_after_unfinished_run(
                         cut_at=0,
                         is_end=True,
                     ),
-                ),
-                "segments_output_directory": Path(f"{resume_file_stem}"),
+                ).to_dict(),
+                "segments_output_directory": f"{resume_file_stem}",
+                "segments_output_directory_created": True,
             },
             f,
         )
@@ -2094,3 +2365,164 @@ def test_ignore_resume_option_after_unfinished_run(
     assert result.exit_code == 0
     assert os.path.exists(tmp_path / f"{video_id}-7959120-7959122-140")
     assert os.path.exists(tmp_path / "segments")
+
+
+@freeze_time("2023-03-26T00:00:00+00:00")
+def test_ignore_leftover_pickled_resume_file(
+    ytpb_cli_invoke: Callable,
+    add_responses_callback_for_reference_base_url: Callable,
+    add_responses_callback_for_segment_urls: Callable,
+    fake_info_fetcher: MagicMock,
+    video_id: str,
+    audio_base_url: str,
+    tmp_path: Path,
+) -> None:
+    # Given:
+    add_responses_callback_for_reference_base_url()
+    add_responses_callback_for_segment_urls(
+        urljoin(audio_base_url, r"sq/\w+"),
+    )
+
+    resume_file_stem = f"{video_id}-7959120-7959122-140"
+    resume_file_path = tmp_path / f"{resume_file_stem}.resume"
+    with open(resume_file_path, "wb") as f:
+        pickle.dump(
+            {
+                "interval": None,
+                "segments_output_directory": Path("other"),
+            },
+            f,
+        )
+
+    # When:
+    with patch("ytpb.cli.common.YtpbInfoFetcher") as mock_fetcher:
+        mock_fetcher.return_value = fake_info_fetcher
+        result = ytpb_cli_invoke(
+            [
+                "--no-config",
+                "download",
+                "--no-cache",
+                "--interval",
+                "7959120/7959122",
+                "-af",
+                "itag eq 140",
+                "-vf",
+                "none",
+                video_id,
+            ],
+            catch_exceptions=False,
+        )
+
+    # Then:
+    assert result.exit_code == 0
+    assert not os.path.exists(tmp_path / "other")
+    assert not os.path.exists(resume_file_path)
+
+
+@freeze_time("2023-03-26T00:00:00+00:00")
+def test_ignore_resume_file_with_unsupported_schema_version(
+    ytpb_cli_invoke: Callable,
+    add_responses_callback_for_reference_base_url: Callable,
+    add_responses_callback_for_segment_urls: Callable,
+    fake_info_fetcher: MagicMock,
+    video_id: str,
+    audio_base_url: str,
+    tmp_path: Path,
+) -> None:
+    # Given:
+    add_responses_callback_for_reference_base_url()
+    add_responses_callback_for_segment_urls(
+        urljoin(audio_base_url, r"sq/\w+"),
+    )
+
+    resume_file_stem = f"{video_id}-7959120-7959122-140"
+    resume_file_path = tmp_path / f"{resume_file_stem}.resume"
+    with open(resume_file_path, "w") as f:
+        json.dump(
+            {
+                "schema_version": 0,
+                "interval": {},
+                "segments_output_directory": "other",
+            },
+            f,
+        )
+
+    # When:
+    with patch("ytpb.cli.common.YtpbInfoFetcher") as mock_fetcher:
+        mock_fetcher.return_value = fake_info_fetcher
+        result = ytpb_cli_invoke(
+            [
+                "--no-config",
+                "download",
+                "--no-cache",
+                "--interval",
+                "7959120/7959122",
+                "-af",
+                "itag eq 140",
+                "-vf",
+                "none",
+                video_id,
+            ],
+            catch_exceptions=False,
+        )
+
+    # Then:
+    assert result.exit_code == 0
+    assert not os.path.exists(tmp_path / "other")
+    assert not os.path.exists(resume_file_path)
+
+
+@freeze_time("2023-03-26T00:00:00+00:00")
+def test_ignore_resume_file_with_malformed_interval(
+    ytpb_cli_invoke: Callable,
+    add_responses_callback_for_reference_base_url: Callable,
+    add_responses_callback_for_segment_urls: Callable,
+    fake_info_fetcher: MagicMock,
+    video_id: str,
+    audio_base_url: str,
+    tmp_path: Path,
+) -> None:
+    # Given:
+    add_responses_callback_for_reference_base_url()
+    add_responses_callback_for_segment_urls(
+        urljoin(audio_base_url, r"sq/\w+"),
+    )
+
+    resume_file_stem = f"{video_id}-7959120-7959122-140"
+    resume_file_path = tmp_path / f"{resume_file_stem}.resume"
+    with open(resume_file_path, "w") as f:
+        json.dump(
+            {
+                "schema_version": 2,
+                "interval": {
+                    "start": {"date": "2023-03-25T23:33:54.491176+00:00"},
+                },
+                "segments_output_directory": "other",
+                "segments_output_directory_created": True,
+            },
+            f,
+        )
+
+    # When:
+    with patch("ytpb.cli.common.YtpbInfoFetcher") as mock_fetcher:
+        mock_fetcher.return_value = fake_info_fetcher
+        result = ytpb_cli_invoke(
+            [
+                "--no-config",
+                "download",
+                "--no-cache",
+                "--interval",
+                "7959120/7959122",
+                "-af",
+                "itag eq 140",
+                "-vf",
+                "none",
+                video_id,
+            ],
+            catch_exceptions=False,
+        )
+
+    # Then:
+    assert result.exit_code == 0
+    assert not os.path.exists(tmp_path / "other")
+    assert not os.path.exists(resume_file_path)
@@ -1,10 +1,14 @@
 import os
+import re
+import threading
+import time
 from pathlib import Path
 from urllib.parse import urljoin
 
 import responses
 
-from ytpb.download import download_segment
+from ytpb.download import download_segment, iter_segments
+from ytpb.utils.url import extract_parameter_from_url
 
 
 def test_download_segment(
@@ -50,3 +54,43 @@ def test_download_segment_with_custom_callable_output_filename(
     # Then:
     assert output_path == tmp_path / "custom"
     assert os.path.exists(output_path)
+
+
+def test_iter_segments_concurrently_in_order(
+    mocked_responses: responses.RequestsMock, audio_base_url: str
+) -> None:
+    # Given:
+    max_workers = 2
+    sequences = list(range(6))
+    requested: list[int] = []
+    completed: list[int] = []
+    lock = threading.Lock()
+
+    def request_callback(request):
+        sequence = int(extract_parameter_from_url("sq", request.url))
+        with lock:
+            requested.append(sequence)
+        # Earlier segments take longer, so requests finish out of order.
+        time.sleep(0.05 * (len(sequences) - sequence))
+        with lock:
+            completed.append(sequence)
+        return 200, {}, str(sequence).encode()
+
+    mocked_responses.add_callback(
+        responses.GET, re.compile(re.escape(audio_base_url)), request_callback
+    )
+
+    # When:
+    yielded: list[int] = []
+    for response, sequence, _ in iter_segments(
+        sequences, audio_base_url, max_workers=max_workers
+    ):
+        with lock:
+            in_flight = len(requested) - len(yielded)
+        assert in_flight <= 2 * max_workers
+        assert response.content == str(sequence).encode()
+        yielded.append(sequence)
+
+    # Then:
+    assert yielded == sequences
+    assert completed != sorted(completed)
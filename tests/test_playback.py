@@ -240,6 +240,77 @@ def test_insert_to_rewind_history(
     assert playback.rewind_history.closest(1679787238.491916).value == 7959122
 
 
+def test_get_located_segment_without_reading_again(
+    fake_info_fetcher: "FakeInfoFetcher",
+    add_responses_callback_for_segment_urls: Callable,
+    mocked_responses: responses.RequestsMock,
+    stream_url: str,
+    audio_base_url: str,
+    fake_stream: "FakeStream",
+    tmp_path: Path,
+) -> None:
+    # Given:
+    add_responses_callback_for_segment_urls(urljoin(audio_base_url, r"sq/\w+"))
+
+    playback = Playback(stream_url, fetcher=fake_info_fetcher)
+    playback.fetch_and_set_essential()
+    playback.locate_moment(7959120, fake_stream)
+    located_segment = playback.get_segment(7959120, fake_stream)
+
+    # When:
+    segment = playback.get_segment(7959120, fake_stream)
+
+    # Then:
+    assert segment is located_segment
+    assert len(mocked_responses.calls) == 1
+
+
+def test_get_deleted_segment_without_download(
+    fake_info_fetcher: "FakeInfoFetcher",
+    add_responses_callback_for_segment_urls: Callable,
+    stream_url: str,
+    audio_base_url: str,
+    fake_stream: "FakeStream",
+    tmp_path: Path,
+) -> None:
+    # Given:
+    add_responses_callback_for_segment_urls(urljoin(audio_base_url, r"sq/\w+"))
+
+    playback = Playback(stream_url, fetcher=fake_info_fetcher)
+    playback.fetch_and_set_essential()
+    segment = playback.get_segment(7959120, fake_stream)
+    segment.local_path.unlink()
+
+    # Then:
+    with pytest.raises(FileNotFoundError):
+        playback.get_segment(7959120, fake_stream, download=False)
+
+
+def test_keep_limited_number_of_read_segments(
+    fake_info_fetcher: "FakeInfoFetcher",
+    add_responses_callback_for_segment_urls: Callable,
+    stream_url: str,
+    audio_base_url: str,
+    fake_stream: "FakeStream",
+    tmp_path: Path,
+) -> None:
+    # Given:
+    add_responses_callback_for_segment_urls(urljoin(audio_base_url, r"sq/\w+"))
+
+    playback = Playback(stream_url, fetcher=fake_info_fetcher)
+    playback.segments_cache_maxsize = 2
+    playback.fetch_and_set_essential()
+
+    # When:
+    first_segment = playback.get_segment(7959120, fake_stream)
+    playback.get_segment(7959121, fake_stream)
+    playback.get_segment(7959122, fake_stream)
+
+    # Then:
+    assert len(playback._segments) == 2
+    assert playback.get_segment(7959120, fake_stream) is not first_segment
+
+
 def test_create_playback_from_url(
     fake_info_fetcher: "FakeInfoFetcher",
     active_live_video_info: YouTubeVideoInfo,
@@ -331,3 +402,18 @@ def test_rewind_interval_properties():
     )
     assert timedelta(seconds=30) == interval.duration
     assert 1001 == len(interval.sequences)
+
+
+def test_rewind_interval_to_and_from_dict():
+    interval = RewindInterval(
+        RewindMoment(datetime(2024, 1, 2, 10, 20, 0, tzinfo=timezone.utc), 0, 0.5),
+        RewindMoment(
+            datetime(2024, 1, 2, 10, 20, 30, tzinfo=timezone.utc),
+            1000,
+            1.5,
+            is_end=True,
+            falls_in_gap=True,
+        ),
+    )
+    serialized = json.dumps(interval.to_dict())
+    assert interval == RewindInterval.from_dict(json.loads(serialized))
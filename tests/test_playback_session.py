@@ -1,4 +1,6 @@
 import copy
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 from unittest.mock import patch
 from urllib.parse import urljoin
@@ -7,7 +9,7 @@ import pytest
 import responses
 from ytpb.errors import MaxRetryError
 
-from ytpb.playback import Playback
+from ytpb.playback import Playback, PlaybackSession
 from ytpb.streams import AudioStream, Streams
 
 
@@ -66,6 +68,48 @@ def test_retry_on_403_for_segment_url(
     assert response.url == refreshed_segment_url
 
 
+def test_refresh_base_url_once_on_concurrent_403(
+    mocked_responses: responses.RequestsMock,
+    mock_fetch_and_set_essential,
+    make_refresh_base_url_side_effect,
+    stream_url: str,
+    audio_base_url: str,
+) -> None:
+    # Given:
+    refreshed_base_url = "https://test.googlevideo.com/videoplayback/test/"
+    for sequence in (0, 1):
+        mocked_responses.get(urljoin(audio_base_url, f"sq/{sequence}"), status=403)
+        mocked_responses.get(urljoin(refreshed_base_url, f"sq/{sequence}"))
+
+    refresh_base_url = make_refresh_base_url_side_effect("140", refreshed_base_url)
+
+    def slow_refresh_base_url(*args, **kwargs):
+        # Let the other request fail before the refresh is done.
+        time.sleep(0.2)
+        refresh_base_url(*args, **kwargs)
+
+    # When:
+    playback = Playback(stream_url)
+    playback.fetch_and_set_essential()
+
+    with patch.object(Playback, "fetch_and_set_essential", autospec=True) as mock:
+        mock.side_effect = slow_refresh_base_url
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            responses_ = list(
+                executor.map(
+                    playback.session.get,
+                    [urljoin(audio_base_url, f"sq/{x}") for x in (0, 1)],
+                )
+            )
+
+    # Then:
+    assert mock.call_count == 1
+    assert [r.url for r in responses_] == [
+        urljoin(refreshed_base_url, "sq/0"),
+        urljoin(refreshed_base_url, "sq/1"),
+    ]
+
+
 def test_retry_on_404_for_segment_url(
     mocked_responses: responses.RequestsMock,
     mock_fetch_and_set_essential,
@@ -148,3 +192,20 @@ def test_retry_head_request_with_segment_base_url(
     # Then:
     assert response.status_code == 200
     assert response.url == refreshed_base_url
+
+
+def test_resize_pool():
+    # Given:
+    session = PlaybackSession()
+    default_adapter = session.get_adapter("https://")
+
+    # When:
+    session.resize_pool(8)
+    not_resized_adapter = session.get_adapter("https://")
+    session.resize_pool(32)
+
+    # Then:
+    assert not_resized_adapter is default_adapter
+    assert session.pool_maxsize == 32
+    assert session.get_adapter("https://") is not default_adapter
+    assert PlaybackSession.pool_maxsize == 16